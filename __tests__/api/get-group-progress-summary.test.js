@@ -0,0 +1,74 @@
+const { describe, test, expect, beforeEach } = require('@jest/globals');
+require('../setup');
+
+const { getGroupProgressSummary } = require('../../api/get-group-progress-summary');
+const {
+  createMockRequest,
+  createMockResponse,
+  createMockDocSnapshot,
+  expectSuccessResponse,
+  expectErrorResponse,
+  mockDbError
+} = require('../helpers/testHelpers');
+
+describe('Get Group Progress Summary API', () => {
+  let req, res;
+
+  beforeEach(() => {
+    req = createMockRequest({}, { groupId: 'test-group-123' });
+    res = createMockResponse();
+  });
+
+  test('should return the stored progress summary', async () => {
+    const mockSummary = {
+      groupId: 'test-group-123',
+      memberCount: 3,
+      totalDays: 299,
+      currentDay: 20,
+      averageCompletedDays: 7,
+      laggingMembers: [{ userId: 'user-c', daysBehind: 20 }]
+    };
+
+    global.mockDb.get.mockResolvedValueOnce(createMockDocSnapshot(mockSummary));
+
+    await getGroupProgressSummary(req, res);
+
+    expectSuccessResponse(res, 200);
+    expect(res.json).toHaveBeenCalledWith(
+      expect.objectContaining({
+        summary: expect.objectContaining({
+          groupId: 'test-group-123',
+          memberCount: 3,
+          currentDay: 20
+        })
+      })
+    );
+    expect(global.mockDb.collection).toHaveBeenCalledWith('groupReadingSchedules');
+    expect(global.mockDb.collection).toHaveBeenCalledWith('analytics');
+    expect(global.mockDb.doc).toHaveBeenCalledWith('progressSummary');
+  });
+
+  test('should return 404 when no summary has been computed', async () => {
+    global.mockDb.get.mockResolvedValueOnce(createMockDocSnapshot(null, false));
+
+    await getGroupProgressSummary(req, res);
+
+    expectErrorResponse(res, 404, 'No progress summary found for this group');
+  });
+
+  test('should return 400 when groupId is missing', async () => {
+    req = createMockRequest({}, {});
+
+    await getGroupProgressSummary(req, res);
+
+    expectErrorResponse(res, 400, 'Missing required parameter: groupId');
+  });
+
+  test('should handle database errors', async () => {
+    mockDbError(new Error('Database connection failed'));
+
+    await getGroupProgressSummary(req, res);
+
+    expectErrorResponse(res, 500, 'Internal server error');
+  });
+});
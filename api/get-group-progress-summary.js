@@ -0,0 +1,57 @@
+const { ensureFirebaseInitialized } = require('../config/firebase');
+
+// Lazy initialization of db
+let db = null;
+async function getDb() {
+  if (!db) {
+    await ensureFirebaseInitialized();
+    const firebaseConfig = require('../config/firebase');
+    db = firebaseConfig.db;
+  }
+  return db;
+}
+
+// Serves the precomputed summary written by scripts/upload_group_summaries.js
+// (from scripts/analytics/progress_analytics.py) - no per-member progress reads.
+async function getGroupProgressSummary(req, res) {
+  try {
+    const { groupId } = req.params;
+
+    if (!groupId) {
+      return res.status(400).json({
+        error: 'Missing required parameter: groupId'
+      });
+    }
+
+    console.log(`Getting progress summary for group ${groupId}`);
+
+    const summaryDoc = await (await getDb())
+      .collection('groupReadingSchedules')
+      .doc(groupId)
+      .collection('analytics')
+      .doc('progressSummary')
+      .get();
+
+    if (!summaryDoc.exists) {
+      return res.status(404).json({
+        error: 'No progress summary found for this group'
+      });
+    }
+
+    res.status(200).json({
+      message: 'Group progress summary retrieved successfully',
+      summary: summaryDoc.data()
+    });
+
+  } catch (error) {
+    console.error('Error getting group progress summary:', error);
+    res.status(500).json({
+      error: 'Internal server error',
+      message: error.message
+    });
+  }
+}
+
+module.exports = {
+  getGroupProgressSummary
+};
@@ -5,6 +5,15 @@ require('dotenv').config();
 // Initialize Firebase Admin SDK
 async function initializeFirebase() {
   if (!admin.apps.length) {
+    // Local Firestore emulator (load testing) - no credentials needed
+    if (process.env.FIRESTORE_EMULATOR_HOST) {
+      admin.initializeApp({
+        projectId: process.env.GCLOUD_PROJECT || 'biblereading-f222a'
+      });
+      console.log(`✓ Firebase initialized against Firestore emulator at ${process.env.FIRESTORE_EMULATOR_HOST}`);
+      return;
+    }
+
     try {
       // Try to get service account from Google Cloud Secret Manager
       const serviceAccount = await secretsManager.getFirebaseServiceAccount();
@@ -12,6 +12,7 @@ const { createReadingSchedule } = require('./api/create-reading-schedule');
 const { createGroupReadingSchedule } = require('./api/create-group-reading-schedule');
 const { joinGroupReadingSchedule, leaveGroupReadingSchedule } = require('./api/join-group-reading-schedule');
 const { getGroupMembers } = require('./api/get-group-members');
+const { getGroupProgressSummary } = require('./api/get-group-progress-summary');
 const { getAvailableGroups } = require('./api/get-available-groups');
 const { getUserSchedules } = require('./api/get-user-schedules');
 const { markReadingCompleted } = require('./api/mark-reading-completed');
@@ -43,6 +44,7 @@ app.post('/create-group-reading-schedule', createGroupReadingSchedule);
 app.post('/join-group-reading-schedule', joinGroupReadingSchedule);
 app.post('/leave-group-reading-schedule', leaveGroupReadingSchedule);
 app.get('/group-members/:groupId', getGroupMembers);
+app.get('/group-progress-summary/:groupId', getGroupProgressSummary);
 app.get('/available-groups', getAvailableGroups);
 
 // Reading Progress endpoints
@@ -2,6 +2,8 @@
 import pandas as pd
 import json
 from datetime import datetime, timedelta
+from split_template import save_split
+from hash_tree import save_hash_tree
 
 def extract_complete_nt_schedule():
     # Read NT sheet 
@@ -208,6 +210,14 @@ if __name__ == "__main__":
                     print(f"  Day {day['dayNumber']}: Started {book}")
         
         print(f"\nData saved to nt_complete_schedule.json")
+
+        # Split into a reusable date-free template plus this year's dated instance
+        template, instance, reused = save_split(reading_data, 'nt_complete_schedule', 'Young People New Testament')
+        print(f"{'Reused' if reused else 'Created'} template {template['templateId']}, instance saved to nt_complete_schedule.instance.json")
+
+        # Hash tree over the day records for cheap upload verification (utilities/verify_hash_tree.js)
+        tree = save_hash_tree(reading_data, 'nt_complete_schedule.hashtree.json')
+        print(f"Hash tree root {tree['root'][:12]}, saved to nt_complete_schedule.hashtree.json")
         
     except Exception as e:
         print(f"Error: {e}")
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+import hashlib
+import json
+import os
+import sys
+
+# Hash tree (Merkle tree) over the day records of an extracted schedule.
+#
+# Leaf  = sha256("leaf:" + canonical JSON of one day as uploaded to dailyReadings/day-NNN)
+# Node  = sha256("node:" + concatenated child hashes), FANOUT children per node
+#
+# Leaves are laid out by dayNumber (leaf N-1 = day N) and an absent day gets
+# MISSING_LEAF, so a missing day document only changes the hashes on its own
+# path instead of shifting every leaf after it.
+#
+# utilities/verify_hash_tree.js uploads the tree next to the day documents and
+# later compares root/subtree hashes with this file, reading only the ranges
+# whose hashes differ. The canonical form must stay in sync with
+# canonicalDay() there.
+
+FANOUT = 16
+MISSING_LEAF = hashlib.sha256(b'missing').hexdigest()
+
+# Fields upload_nt_schedule.js writes for each day (timestamps excluded)
+DAY_FIELDS = ['dayNumber', 'date', 'dayOfWeek', 'startBookName', 'startBookId', 'endBookName', 'endBookId', 'portions', 'rawReading']
+PORTION_FIELDS = ['bookId', 'bookName', 'startChapter', 'startVerse', 'endChapter', 'endVerse', 'portionOrder']
+
+
+def canonical_day(day):
+    """Canonical JSON for one day: known fields only, None/missing dropped, keys sorted"""
+    record = {}
+    for field in DAY_FIELDS:
+        value = day.get(field)
+        if value is None or (field == 'rawReading' and not value):
+            continue
+        if field == 'portions':
+            value = [
+                {k: portion[k] for k in PORTION_FIELDS if portion.get(k) is not None}
+                for portion in value
+            ]
+        record[field] = value
+    return json.dumps(record, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+
+
+def leaf_hash(day):
+    return hashlib.sha256(('leaf:' + canonical_day(day)).encode('utf-8')).hexdigest()
+
+
+def node_hash(child_hashes):
+    return hashlib.sha256(('node:' + ''.join(child_hashes)).encode('utf-8')).hexdigest()
+
+
+def build_hash_tree(reading_data, fanout=FANOUT, day_count=0):
+    """Hash tree levels from leaves (one per dayNumber 1..day_count) up to the root"""
+    days = {day['dayNumber']: day for day in reading_data}
+    day_count = max(day_count, max(days, default=0))
+    levels = [[leaf_hash(days[n]) if n in days else MISSING_LEAF for n in range(1, day_count + 1)]]
+    while len(levels[-1]) > 1:
+        below = levels[-1]
+        levels.append([node_hash(below[i:i + fanout]) for i in range(0, len(below), fanout)])
+
+    return {
+        'algorithm': 'sha256',
+        'fanout': fanout,
+        'dayCount': day_count,
+        'root': levels[-1][0] if levels[0] else node_hash([]),
+        'levels': levels
+    }
+
+
+def save_hash_tree(reading_data, output_file, fanout=FANOUT):
+    tree = build_hash_tree(reading_data, fanout)
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(tree, f, indent=2)
+    return tree
+
+
+if __name__ == "__main__":
+    try:
+        schedule_file = sys.argv[1] if len(sys.argv) > 1 else 'nt_reading_schedule_crossbook.json'
+        output_file = sys.argv[2] if len(sys.argv) > 2 else os.path.splitext(schedule_file)[0] + '.hashtree.json'
+
+        with open(schedule_file, 'r', encoding='utf-8') as f:
+            reading_data = json.load(f)
+
+        tree = save_hash_tree(reading_data, output_file)
+        print(f"Built hash tree over {tree['dayCount']} days ({len(tree['levels'])} levels, fanout {tree['fanout']})")
+        print(f"  Root: {tree['root']}")
+        print(f"\nData saved to {output_file}")
+
+    except Exception as e:
+        print(f"Error: {e}")
+        import traceback
+        traceback.print_exc()
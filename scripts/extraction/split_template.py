@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+import hashlib
+import json
+import os
+import sys
+from datetime import datetime, timedelta
+
+# Split an extracted schedule into a content-addressed template and a dated instance.
+#
+# Most school years repeat the same portion sequence with shifted dates, so the
+# date-free part (ordered portions per day, the shape readingTemplates/{id}/dailyReadings
+# holds) is stored once under an id derived from its content hash. Each year's
+# extraction only adds a small instance file: template id + start date.
+#
+#   templates/tpl-<hash16>.json   -> template doc fields + "dailyReadings"
+#   <name>.instance.json          -> templateId, contentHash, startDate, endDate, ...
+#
+# Re-extracting an identical sequence produces the same template id, so the
+# existing template file (and the uploaded template in Firestore) is reused.
+
+TEMPLATES_DIR = 'templates'
+
+PORTION_FIELDS = ['bookName', 'bookId', 'startChapter', 'startVerse', 'endChapter', 'endVerse', 'portionOrder']
+
+
+def template_day(day):
+    """Date-free reading for one day: ordered portions plus start/end book fields"""
+    portions = [{field: portion.get(field) for field in PORTION_FIELDS} for portion in day['portions']]
+    return {
+        'dayNumber': day['dayNumber'],
+        'startBookName': day.get('startBookName', portions[0]['bookName'] if portions else None),
+        'startBookId': day.get('startBookId', portions[0]['bookId'] if portions else None),
+        'endBookName': day.get('endBookName', portions[-1]['bookName'] if portions else None),
+        'endBookId': day.get('endBookId', portions[-1]['bookId'] if portions else None),
+        'portions': portions
+    }
+
+
+def content_hash(template_days):
+    """SHA-256 of the canonical JSON of the ordered template days"""
+    canonical = json.dumps(template_days, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def build_template(reading_data, name, description=None):
+    """Template document (as served by api/get-reading-templates.js) with its daily readings"""
+    days = [template_day(day) for day in sorted(reading_data, key=lambda d: d['dayNumber'])]
+    digest = content_hash(days)
+    return {
+        'templateId': f'tpl-{digest[:16]}',
+        'contentHash': digest,
+        'name': name,
+        'description': description,
+        'durationDays': len(days),
+        'category': 'general',
+        'difficulty': 'medium',
+        'isTemplate': True,
+        'createdAt': datetime.now().isoformat(),
+        'dailyReadings': days
+    }
+
+
+def build_instance(reading_data, template, plan_id):
+    """Dated instance pointing at a template: start date, plus explicit dates only if they aren't consecutive"""
+    days = sorted(reading_data, key=lambda d: d['dayNumber'])
+    start = datetime.strptime(days[0]['date'], '%Y-%m-%d')
+    dates = [day['date'] for day in days]
+    consecutive = all(
+        date == (start + timedelta(days=i)).strftime('%Y-%m-%d') for i, date in enumerate(dates)
+    )
+
+    instance = {
+        'planId': plan_id,
+        'templateId': template['templateId'],
+        'contentHash': template['contentHash'],
+        'startDate': dates[0],
+        'endDate': dates[-1],
+        'durationDays': len(days)
+    }
+    if not consecutive:
+        instance['dates'] = dates
+    return instance
+
+
+def save_split(reading_data, plan_id, name, templates_dir=TEMPLATES_DIR, output_dir='.'):
+    """Write the instance and, unless one with the same content already exists, the template.
+
+    Returns (template, instance, reused).
+    """
+    template = build_template(reading_data, name)
+    template_file = os.path.join(templates_dir, f"{template['templateId']}.json")
+
+    reused = False
+    if os.path.exists(template_file):
+        with open(template_file, 'r', encoding='utf-8') as f:
+            existing = json.load(f)
+        if existing.get('contentHash') == template['contentHash']:
+            template = existing
+            reused = True
+
+    if not reused:
+        os.makedirs(templates_dir, exist_ok=True)
+        with open(template_file, 'w', encoding='utf-8') as f:
+            json.dump(template, f, indent=2, ensure_ascii=False)
+
+    instance = build_instance(reading_data, template, plan_id)
+    with open(os.path.join(output_dir, f'{plan_id}.instance.json'), 'w', encoding='utf-8') as f:
+        json.dump(instance, f, indent=2, ensure_ascii=False)
+
+    return template, instance, reused
+
+
+if __name__ == "__main__":
+    try:
+        schedule_file = sys.argv[1] if len(sys.argv) > 1 else 'nt_reading_schedule_crossbook.json'
+        plan_id = sys.argv[2] if len(sys.argv) > 2 else os.path.splitext(os.path.basename(schedule_file))[0]
+        templates_dir = sys.argv[3] if len(sys.argv) > 3 else TEMPLATES_DIR
+
+        with open(schedule_file, 'r', encoding='utf-8') as f:
+            reading_data = json.load(f)
+
+        template, instance, reused = save_split(reading_data, plan_id, 'Young People New Testament', templates_dir)
+
+        if reused:
+            print(f"✓ Reused existing template {template['templateId']} ({template['durationDays']} days)")
+        else:
+            print(f"✓ Created template {template['templateId']} ({template['durationDays']} days)")
+        print(f"  Instance {plan_id}: {instance['startDate']} - {instance['endDate']}")
+        print(f"\nData saved to {templates_dir}/{template['templateId']}.json and {plan_id}.instance.json")
+
+    except Exception as e:
+        print(f"Error: {e}")
+        import traceback
+        traceback.print_exc()
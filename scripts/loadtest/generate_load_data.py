@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+import numpy as np
+import aiohttp
+import asyncio
+import argparse
+import json
+from datetime import datetime, timedelta
+
+# Deterministic synthetic dataset for load testing the schedule/progress APIs.
+#
+# Uses an extracted plan JSON (e.g. nt_reading_schedule_crossbook.json) as the
+# template and produces the same Firestore layout the Express routes read:
+#   readingTemplates/{templateId}/dailyReadings/{NNN}
+#   userProfiles/{userId}
+#   groupReadingSchedules/{groupId}
+#     members/{userId}
+#     dailySchedule/{NNN}
+#     progress/{userId}/dailyProgress/{NNN}
+#
+# Everything is derived from --seed, and each group has its own RNG stream, so
+# the load test can rebuild the group roster without regenerating progress.
+
+PLAN_FILE = 'nt_reading_schedule_crossbook.json'
+TEMPLATE_ID = 'loadtestNT'
+PROJECT_ID = 'biblereading-f222a'
+EMULATOR_HOST = 'localhost:8080'
+AS_OF_DATE = '2025-03-01'  # Fixed "today" so datasets don't change between runs
+
+BATCH_SIZE = 500  # Firestore commit limit
+DAY_NAMES = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+
+def load_plan(plan_file):
+    """Load extracted plan days sorted by dayNumber"""
+    with open(plan_file, 'r', encoding='utf-8') as f:
+        plan = json.load(f)
+    return sorted(plan, key=lambda day: day['dayNumber'])
+
+
+def user_id(index):
+    return f'loadtest-user-{index:07d}'
+
+
+def group_id(index):
+    return f'loadtest-group-{index:05d}'
+
+
+def fit_group_sizes(weights, total, min_size, max_size):
+    """Integer sizes proportional to weights, clipped to [min_size, max_size], summing to total"""
+    # Bisect the scale factor: the clipped sum grows monotonically with it
+    low, high = 0.0, max_size / weights.min()
+    for _ in range(100):
+        scale = (low + high) / 2
+        if np.clip(weights * scale, min_size, max_size).sum() < total:
+            low = scale
+        else:
+            high = scale
+    exact = np.clip(weights * high, min_size, max_size)
+
+    # Round down, then hand the remainder to the largest fractional parts
+    sizes = np.floor(exact).astype(np.int64)
+    remainder = total - int(sizes.sum())
+    if remainder > 0:
+        fractions = np.where(sizes < max_size, exact - sizes, -1.0)
+        sizes[np.argsort(-fractions, kind='stable')[:remainder]] += 1
+    return sizes
+
+
+def generate_groups(seed, num_groups, num_users, max_group_size, total_days, as_of=AS_OF_DATE):
+    """Build the group roster: size, first user index, start date and current day per group.
+
+    Group sizes follow a log-normal distribution (most groups are small, a few
+    are large) and are scaled so the groups hold exactly num_users users. Start
+    dates are spread over the length of the plan so groups sit at every stage of it.
+    """
+    if num_users < num_groups or num_users > num_groups * max_group_size:
+        raise ValueError(f'Cannot place {num_users} users in {num_groups} groups of 1-{max_group_size} members')
+
+    rng = np.random.default_rng(seed)
+    weights = rng.lognormal(mean=np.log(12), sigma=1.0, size=num_groups)
+    sizes = fit_group_sizes(weights, num_users, 2 if num_users >= 2 * num_groups else 1, max_group_size)
+
+    first_user = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+    days_in = rng.integers(1, total_days + 1, size=num_groups)
+
+    as_of_date = datetime.strptime(as_of, '%Y-%m-%d')
+    groups = []
+    for i in range(num_groups):
+        current_day = int(days_in[i])
+        groups.append({
+            'index': i,
+            'groupId': group_id(i),
+            'size': int(sizes[i]),
+            'firstUser': int(first_user[i]),
+            'currentDay': current_day,
+            'startDate': (as_of_date - timedelta(days=current_day - 1)).strftime('%Y-%m-%d')
+        })
+    return groups
+
+
+def generate_completions(seed, group, total_days):
+    """Completed day numbers for each member of a group, as a (members, days) bool matrix.
+
+    Each member gets a consistency rate from Beta(4, 1.5) (most read most days)
+    and about a quarter of members stop reading after an exponentially
+    distributed number of days, which gives the long tail seen in real groups.
+    """
+    rng = np.random.default_rng([seed, group['index']])
+    size = group['size']
+    current_day = min(group['currentDay'], total_days)
+
+    consistency = rng.beta(4, 1.5, size=size)
+    drops_out = rng.random(size) < 0.25
+    last_day = np.where(drops_out, rng.exponential(30, size=size).astype(np.int64) + 1, current_day)
+    last_day = np.minimum(last_day, current_day)
+
+    day_index = np.arange(1, total_days + 1)
+    reached = day_index[np.newaxis, :] <= last_day[:, np.newaxis]
+    return reached & (rng.random((size, total_days)) < consistency[:, np.newaxis])
+
+
+def add_days(date_str, offset):
+    return (datetime.strptime(date_str, '%Y-%m-%d') + timedelta(days=offset)).strftime('%Y-%m-%d')
+
+
+def template_documents(plan, template_id):
+    """Template document and its dailyReadings, as in create_reading_template.js"""
+    yield f'readingTemplates/{template_id}', {
+        'name': 'Load Test New Testament',
+        'description': 'Synthetic template for load testing',
+        'templateId': template_id,
+        'isTemplate': True,
+        'durationDays': len(plan),
+        'category': 'loadtest',
+        'createdAt': AS_OF_DATE
+    }
+    for day in plan:
+        yield f'readingTemplates/{template_id}/dailyReadings/{day["dayNumber"]:03d}', reading_fields(day)
+
+
+def reading_fields(day):
+    portions = day['portions']
+    return {
+        'dayNumber': day['dayNumber'],
+        'rawReading': day.get('rawReading'),
+        'startBookName': day.get('startBookName', portions[0]['bookName'] if portions else None),
+        'startBookId': day.get('startBookId', portions[0]['bookId'] if portions else None),
+        'endBookName': day.get('endBookName', portions[-1]['bookName'] if portions else None),
+        'endBookId': day.get('endBookId', portions[-1]['bookId'] if portions else None),
+        'portions': portions
+    }
+
+
+def group_documents(seed, group, plan, template_id):
+    """All documents for one group, in the shape create/join/mark-reading-completed write them"""
+    total_days = len(plan)
+    gid = group['groupId']
+    start_date = group['startDate']
+    members = [user_id(group['firstUser'] + i) for i in range(group['size'])]
+    completions = generate_completions(seed, group, total_days)
+
+    yield f'groupReadingSchedules/{gid}', {
+        'groupId': gid,
+        'groupName': f'Load Test Group {group["index"]}',
+        'templateId': template_id,
+        'templateName': 'Load Test New Testament',
+        'startDate': start_date,
+        'endDate': add_days(start_date, total_days - 1),
+        'durationDays': total_days,
+        'currentDay': group['currentDay'],
+        'status': 'active',
+        'createdBy': members[0],
+        'isPublic': True,
+        'maxMembers': None,
+        'completionTasks': {'verseText': True, 'footnotes': False, 'partner': False},
+        'createdAt': start_date,
+        'updatedAt': start_date
+    }
+
+    scheduled_dates = [add_days(start_date, i) for i in range(total_days)]
+    for i, day in enumerate(plan):
+        fields = reading_fields(day)
+        fields['scheduledDate'] = scheduled_dates[i]
+        fields['dayOfWeek'] = DAY_NAMES[datetime.strptime(scheduled_dates[i], '%Y-%m-%d').weekday()]
+        yield f'groupReadingSchedules/{gid}/dailySchedule/{day["dayNumber"]:03d}', fields
+
+    for m, uid in enumerate(members):
+        done_days = np.flatnonzero(completions[m])
+        last_done = int(done_days[-1]) + 1 if len(done_days) else 1
+
+        yield f'userProfiles/{uid}', {
+            'uid': uid,
+            'email': f'{uid}@loadtest.local',
+            'displayName': f'Load Test User {group["firstUser"] + m}',
+            'timezone': 'America/Los_Angeles',
+            'preferredLanguage': 'en',
+            'isActive': True
+        }
+        yield f'groupReadingSchedules/{gid}/members/{uid}', {
+            'userId': uid,
+            'userName': f'Load Test User {group["firstUser"] + m}',
+            'joinedAt': start_date,
+            'role': 'admin' if m == 0 else 'member',
+            'status': 'active',
+            'currentDay': last_done,
+            'completedDays': len(done_days),
+            'lastActiveAt': scheduled_dates[last_done - 1]
+        }
+        for d in done_days:
+            completed_at = scheduled_dates[d]
+            yield f'groupReadingSchedules/{gid}/progress/{uid}/dailyProgress/{d + 1:03d}', {
+                'dayNumber': int(d + 1),
+                'isCompleted': True,
+                'completionTasks': {'verseText': True, 'footnotes': False, 'partner': False},
+                'scheduledDate': completed_at,
+                'completedAt': completed_at,
+                'updatedAt': completed_at
+            }
+
+
+def dataset_documents(seed, groups, plan, template_id):
+    yield from template_documents(plan, template_id)
+    for group in groups:
+        yield from group_documents(seed, group, plan, template_id)
+
+
+def to_firestore_value(value):
+    """Encode a Python value in Firestore REST API form"""
+    if value is None:
+        return {'nullValue': None}
+    if isinstance(value, bool):
+        return {'booleanValue': value}
+    if isinstance(value, (int, np.integer)):
+        return {'integerValue': str(int(value))}
+    if isinstance(value, (float, np.floating)):
+        return {'doubleValue': float(value)}
+    if isinstance(value, dict):
+        return {'mapValue': {'fields': {k: to_firestore_value(v) for k, v in value.items()}}}
+    if isinstance(value, (list, tuple)):
+        return {'arrayValue': {'values': [to_firestore_value(v) for v in value]}}
+    return {'stringValue': str(value)}
+
+
+async def bulk_load(documents, emulator_host, project_id, concurrency):
+    """Write documents to the Firestore emulator with concurrent 500-write commits"""
+    base = f'projects/{project_id}/databases/(default)/documents'
+    url = f'http://{emulator_host}/v1/{base}:commit'
+    # "owner" bypasses security rules on the emulator
+    headers = {'Authorization': 'Bearer owner'}
+    queue = asyncio.Queue(maxsize=concurrency * 2)
+    written = 0
+
+    async def worker(session):
+        nonlocal written
+        while True:
+            batch = await queue.get()
+            if batch is None:
+                return
+            body = {'writes': [
+                {'update': {'name': f'{base}/{path}', 'fields': {k: to_firestore_value(v) for k, v in fields.items()}}}
+                for path, fields in batch
+            ]}
+            async with session.post(url, json=body, headers=headers) as response:
+                if response.status != 200:
+                    raise RuntimeError(f'Commit failed ({response.status}): {await response.text()}')
+            written += len(batch)
+            if written % 100000 < len(batch):
+                print(f"  Written {written} documents")
+
+    async def put(item, workers):
+        # A worker that died (emulator unreachable, failed commit) stops draining
+        # the queue - raise its error instead of blocking on a full queue forever
+        put_task = asyncio.ensure_future(queue.put(item))
+        while not put_task.done():
+            running = [task for task in workers if not task.done()]
+            await asyncio.wait([put_task, *running], return_when=asyncio.FIRST_COMPLETED)
+            for task in workers:
+                if task.done() and task.exception() is not None:
+                    put_task.cancel()
+                    raise task.exception()
+
+    async with aiohttp.ClientSession() as session:
+        workers = [asyncio.create_task(worker(session)) for _ in range(concurrency)]
+        try:
+            batch = []
+            for doc in documents:
+                batch.append(doc)
+                if len(batch) >= BATCH_SIZE:
+                    await put(batch, workers)
+                    batch = []
+            if batch:
+                await put(batch, workers)
+            for _ in workers:
+                await put(None, workers)
+            await asyncio.gather(*workers)
+        finally:
+            for task in workers:
+                task.cancel()
+
+    return written
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Generate and load a synthetic dataset into the Firestore emulator')
+    parser.add_argument('--plan', default=PLAN_FILE)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--groups', type=int, default=2000)
+    parser.add_argument('--users', type=int, default=50000)
+    parser.add_argument('--max-group-size', type=int, default=500)
+    parser.add_argument('--template-id', default=TEMPLATE_ID)
+    parser.add_argument('--emulator-host', default=EMULATOR_HOST)
+    parser.add_argument('--project', default=PROJECT_ID)
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--dry-run', action='store_true', help='Count documents without writing them')
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    try:
+        args = parse_args()
+        plan = load_plan(args.plan)
+        groups = generate_groups(args.seed, args.groups, args.users, args.max_group_size, len(plan))
+        total_members = sum(g['size'] for g in groups)
+        print(f"Generated roster: {len(groups)} groups, {total_members} users, {len(plan)} plan days")
+        print(f"  Largest group: {max(g['size'] for g in groups)} members")
+
+        documents = dataset_documents(args.seed, groups, plan, args.template_id)
+        started = datetime.now()
+
+        if args.dry_run:
+            count = sum(1 for _ in documents)
+            print(f"Dry run: {count} documents would be written")
+        else:
+            print(f"Loading into Firestore emulator at {args.emulator_host} (project {args.project})...")
+            count = asyncio.run(bulk_load(documents, args.emulator_host, args.project, args.concurrency))
+            print(f"✓ Wrote {count} documents")
+
+        elapsed = (datetime.now() - started).total_seconds()
+        print(f"  {elapsed:.1f}s ({count / max(elapsed, 1e-9):.0f} docs/s)")
+
+    except Exception as e:
+        print(f"Error: {e}")
+        import traceback
+        traceback.print_exc()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+import numpy as np
+import aiohttp
+import asyncio
+import argparse
+import time
+from datetime import datetime
+
+from generate_load_data import load_plan, generate_groups, user_id, PLAN_FILE
+
+# Concurrent load test of the Express routes against a dataset written by
+# generate_load_data.py. Pass the same --seed/--groups/--users/--max-group-size
+# so requests target users and groups that actually exist.
+#
+# Start the server against the emulator first, e.g.
+#   FIRESTORE_EMULATOR_HOST=localhost:8080 node server.js
+
+BASE_URL = 'http://localhost:3000'
+
+# Relative weight of each endpoint in the request mix
+ENDPOINT_MIX = {
+    'get-reading-schedule-with-progress': 4,
+    'get-schedule-progress': 2,
+    'get-day-reading': 6,
+    'group-members': 1,
+    'mark-reading-completed': 2
+}
+
+
+def build_request(name, group, uid, rng, total_days):
+    """Method, path, query params and JSON body for one request to an endpoint"""
+    gid = group['groupId']
+    day = int(rng.integers(1, min(group['currentDay'], total_days) + 1))
+
+    if name == 'get-reading-schedule-with-progress':
+        return 'GET', '/api/get-reading-schedule-with-progress', {'userId': uid, 'groupId': gid}, None
+    if name == 'get-schedule-progress':
+        return 'GET', '/api/get-schedule-progress', {'userId': uid, 'groupId': gid}, None
+    if name == 'get-day-reading':
+        return 'GET', '/api/get-day-reading', {'userId': uid, 'groupId': gid, 'dayNumber': day}, None
+    if name == 'group-members':
+        return 'GET', f'/api/group-members/{gid}', None, None
+    if name == 'mark-reading-completed':
+        return 'POST', '/api/mark-reading-completed', None, {
+            'userId': uid,
+            'groupId': gid,
+            'dayNumber': day,
+            'completionTasks': {'verseText': True, 'footnotes': False, 'partner': False}
+        }
+    raise ValueError(f'Unknown endpoint: {name}')
+
+
+async def run_load(base_url, groups, total_days, seed, concurrency, total_requests, duration):
+    """Drive the endpoint mix with `concurrency` workers; returns latencies and status counts per endpoint"""
+    names = list(ENDPOINT_MIX.keys())
+    weights = np.array([ENDPOINT_MIX[n] for n in names], dtype=float)
+    weights /= weights.sum()
+
+    # Pick users uniformly, so larger groups get proportionally more traffic
+    first_users = np.array([g['firstUser'] for g in groups])
+    num_users = sum(g['size'] for g in groups)
+
+    latencies = {name: [] for name in names}
+    statuses = {name: {} for name in names}
+    issued = 0
+    deadline = time.perf_counter() + duration if duration else None
+
+    async def worker(worker_index, session):
+        nonlocal issued
+        rng = np.random.default_rng([seed, worker_index])
+        while True:
+            if total_requests and issued >= total_requests:
+                return
+            if deadline and time.perf_counter() >= deadline:
+                return
+            issued += 1
+
+            user_index = int(rng.integers(num_users))
+            group = groups[int(np.searchsorted(first_users, user_index, side='right')) - 1]
+            name = names[int(rng.choice(len(names), p=weights))]
+            method, path, params, body = build_request(name, group, user_id(user_index), rng, total_days)
+
+            started = time.perf_counter()
+            try:
+                async with session.request(method, base_url + path, params=params, json=body) as response:
+                    await response.read()
+                    status = response.status
+            except aiohttp.ClientError as e:
+                status = type(e).__name__
+            latencies[name].append(time.perf_counter() - started)
+            statuses[name][status] = statuses[name].get(status, 0) + 1
+
+    connector = aiohttp.TCPConnector(limit=concurrency)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        await asyncio.gather(*(worker(i, session) for i in range(concurrency)))
+
+    return latencies, statuses
+
+
+def print_report(latencies, statuses, elapsed):
+    print(f"\n{'Endpoint':38} {'Requests':>9} {'Req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}  Statuses")
+    total = 0
+    for name, samples in latencies.items():
+        if not samples:
+            continue
+        total += len(samples)
+        p50, p95, p99 = np.percentile(np.array(samples) * 1000, [50, 95, 99])
+        status_text = ', '.join(f'{k}: {v}' for k, v in sorted(statuses[name].items(), key=lambda kv: str(kv[0])))
+        print(f"{name:38} {len(samples):>9} {len(samples) / elapsed:>8.1f} {p50:>8.1f} {p95:>8.1f} {p99:>8.1f}  {status_text}")
+    print(f"\nTotal: {total} requests in {elapsed:.1f}s ({total / elapsed:.1f} req/s)")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Load test the schedule and progress APIs')
+    parser.add_argument('--base-url', default=BASE_URL)
+    parser.add_argument('--plan', default=PLAN_FILE)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--groups', type=int, default=2000)
+    parser.add_argument('--users', type=int, default=50000)
+    parser.add_argument('--max-group-size', type=int, default=500)
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--requests', type=int, default=5000, help='Total requests (0 = until --duration)')
+    parser.add_argument('--duration', type=float, default=0, help='Seconds to run (0 = until --requests)')
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    try:
+        args = parse_args()
+        if not args.requests and not args.duration:
+            raise ValueError('Set --requests or --duration')
+
+        plan = load_plan(args.plan)
+        groups = generate_groups(args.seed, args.groups, args.users, args.max_group_size, len(plan))
+        print(f"Load testing {args.base_url} with {args.concurrency} concurrent clients")
+        print(f"  Dataset: {len(groups)} groups, {sum(g['size'] for g in groups)} users (seed {args.seed})")
+
+        started = datetime.now()
+        latencies, statuses = asyncio.run(run_load(
+            args.base_url, groups, len(plan), args.seed, args.concurrency, args.requests, args.duration
+        ))
+        print_report(latencies, statuses, (datetime.now() - started).total_seconds())
+
+    except Exception as e:
+        print(f"Error: {e}")
+        import traceback
+        traceback.print_exc()
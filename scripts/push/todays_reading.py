@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+import numpy as np
+import argparse
+import json
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+# Batched "today's reading" resolver for the daily push job.
+#
+# Instead of scanning a plan's day list per user (`[d for d in reading_data if d['date'] == date]`),
+# every plan's dates are indexed once into one sorted array of (plan, date) keys.
+# A batch of users is then resolved with a single np.searchsorted:
+#
+#   local date  = now in the user's timezone
+#   plan date   = local date - user's schedule start offset (days started late)
+#   day         = plan day scheduled on that plan date, if any
+#
+# Plans can be given as an extracted schedule (list of days with 'date') or as
+# a split template + instance from extraction/split_template.py. On the command
+# line each plan is a planId=schedule.json or planId=template.json:instance.json spec:
+#
+#   python scripts/push/todays_reading.py nt=nt_reading_schedule_crossbook.json \
+#       ypnt=templates/tpl-<hash16>.json:ypnt.instance.json --users users.jsonl
+
+EPOCH = datetime(1970, 1, 1)
+DATE_BITS = 32  # Low bits of the (plan, date) key hold the date
+
+
+def date_to_ordinal(date_str):
+    """Days since 1970-01-01 for a YYYY-MM-DD string"""
+    return (datetime.strptime(date_str, '%Y-%m-%d') - EPOCH).days
+
+
+def ordinal_to_date(ordinal):
+    return (EPOCH + timedelta(days=int(ordinal))).strftime('%Y-%m-%d')
+
+
+def plan_from_schedule(reading_data):
+    """Plan (dates + days) from an extracted schedule JSON"""
+    days = sorted(reading_data, key=lambda d: d['dayNumber'])
+    return {
+        'dates': np.array([date_to_ordinal(d['date']) for d in days], dtype=np.int64),
+        'days': days
+    }
+
+
+def plan_from_template(template, instance):
+    """Plan (dates + days) from a split template and its dated instance"""
+    days = sorted(template['dailyReadings'], key=lambda d: d['dayNumber'])
+    if 'dates' in instance:
+        dates = [date_to_ordinal(d) for d in instance['dates']]
+    else:
+        start = date_to_ordinal(instance['startDate'])
+        dates = [start + i for i in range(len(days))]
+    return {'dates': np.array(dates, dtype=np.int64), 'days': days}
+
+
+def build_resolver(plans):
+    """Index all plans once: one sorted (plan, date) key array plus the matching day for each key.
+
+    `plans` maps planId -> plan from plan_from_schedule / plan_from_template.
+    """
+    plan_ids = sorted(plans)
+    keys = []
+    day_refs = []
+    for code, plan_id in enumerate(plan_ids):
+        dates = plans[plan_id]['dates']
+        keys.append((np.int64(code) << DATE_BITS) + dates)
+        day_refs.extend((plan_id, i) for i in range(len(dates)))
+
+    keys = np.concatenate(keys) if keys else np.array([], dtype=np.int64)
+    order = np.argsort(keys, kind='stable')
+    return {
+        'planIds': np.array(plan_ids),
+        'plans': plans,
+        'keys': keys[order],
+        'dayRefs': [day_refs[i] for i in order]
+    }
+
+
+def timezone_offsets(timezones, now):
+    """UTC offset in seconds for each entry, looking each distinct timezone up once"""
+    unique_zones, zone_of_user = np.unique(np.asarray(timezones, dtype=str), return_inverse=True)
+    offsets = np.empty(len(unique_zones), dtype=np.int64)
+    for i, name in enumerate(unique_zones):
+        try:
+            offsets[i] = int(now.astimezone(ZoneInfo(name)).utcoffset().total_seconds())
+        except (ZoneInfoNotFoundError, ValueError):
+            offsets[i] = 0  # Unknown timezone: fall back to UTC
+    return offsets[zone_of_user]
+
+
+def resolve_batch(resolver, plan_ids, timezones, start_offsets, now=None):
+    """Resolve today's plan day for a batch of users in one vectorized pass.
+
+    Returns (key_index, local_dates): key_index[i] indexes resolver['dayRefs'] for
+    user i, or is -1 when the user has no reading today (unknown plan, before
+    the plan starts, after it ends, or a date the plan skips).
+    """
+    now = now or datetime.now(timezone.utc)
+    now_seconds = int(now.timestamp())
+
+    local_dates = (now_seconds + timezone_offsets(timezones, now)) // 86400
+    plan_dates = local_dates - np.asarray(start_offsets, dtype=np.int64)
+
+    keys = resolver['keys']
+    if not len(keys):
+        return np.full(len(plan_dates), -1, dtype=np.int64), local_dates
+
+    # Map plan ids to the resolver's plan codes
+    known_ids = resolver['planIds']
+    plan_ids = np.asarray(plan_ids, dtype=str)
+    codes = np.minimum(np.searchsorted(known_ids, plan_ids), len(known_ids) - 1)
+    known = known_ids[codes] == plan_ids
+
+    wanted = (codes.astype(np.int64) << DATE_BITS) + plan_dates
+    position = np.minimum(np.searchsorted(keys, wanted), len(keys) - 1)
+    found = known & (keys[position] == wanted)
+
+    return np.where(found, position, -1), local_dates
+
+
+def reading_for(resolver, key_index):
+    """Day record (dayNumber, portions, ...) for one resolved key index, or None"""
+    if key_index < 0:
+        return None
+    plan_id, i = resolver['dayRefs'][key_index]
+    return resolver['plans'][plan_id]['days'][i]
+
+
+def load_plan_spec(spec):
+    """(planId, plan) from a planId=schedule.json or planId=template.json:instance.json spec"""
+    plan_id, sep, files = spec.partition('=')
+    if not sep or not plan_id or not files:
+        raise ValueError(f"Plan spec must be planId=schedule.json or planId=template.json:instance.json, got '{spec}'")
+
+    template_file, _, instance_file = files.partition(':')
+    with open(template_file, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if not instance_file:
+        return plan_id, plan_from_schedule(data)
+
+    with open(instance_file, 'r', encoding='utf-8') as f:
+        instance = json.load(f)
+    return plan_id, plan_from_template(data, instance)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Resolve today's reading for a batch of users")
+    parser.add_argument('plans', nargs='*', default=['nt=nt_reading_schedule_crossbook.json'],
+                        help='planId=schedule.json or planId=template.json:instance.json, one per plan')
+    parser.add_argument('--users', help='JSONL with userId, planId, timezone, startOffset per line; omit for a demo batch')
+    parser.add_argument('--output', default='todays_readings.jsonl')
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    try:
+        args = parse_args()
+        plans = dict(load_plan_spec(spec) for spec in args.plans)
+        resolver = build_resolver(plans)
+        print(f"Indexed {len(plans)} plan(s): {', '.join(sorted(plans))}")
+
+        if args.users:
+            with open(args.users, 'r', encoding='utf-8') as f:
+                users = [json.loads(line) for line in f if line.strip()]
+            # A lone plan is the default; with several, users must name theirs
+            default_plan = next(iter(plans)) if len(plans) == 1 else ''
+            user_ids = [u['userId'] for u in users]
+            plan_ids = [u.get('planId') or default_plan for u in users]
+            timezones = [u.get('timezone') or 'UTC' for u in users]
+            start_offsets = [u.get('startOffset', 0) for u in users]
+            now = None
+        else:
+            # Demo batch: a million users spread over the plans and a few timezones, "now" inside the first plan
+            n = 1_000_000
+            rng = np.random.default_rng(1)
+            zones = ['America/Los_Angeles', 'America/New_York', 'Europe/London', 'Asia/Taipei', 'Australia/Sydney']
+            user_ids = [f'user-{i:07d}' for i in range(n)]
+            plan_ids = np.array(list(plans))[rng.integers(len(plans), size=n)]
+            timezones = np.array(zones)[rng.integers(len(zones), size=n)]
+            start_offsets = rng.integers(0, 14, size=n)
+            first_dates = next(iter(plans.values()))['dates']
+            now = (EPOCH + timedelta(days=int(first_dates[len(first_dates) // 2]), hours=12)).replace(tzinfo=timezone.utc)
+
+        started = datetime.now()
+        key_index, local_dates = resolve_batch(resolver, plan_ids, timezones, start_offsets, now)
+        elapsed = (datetime.now() - started).total_seconds()
+
+        unknown_plan = ~np.isin(np.asarray(plan_ids, dtype=str), resolver['planIds'])
+        resolved = int(np.count_nonzero(key_index >= 0))
+        print(f"Resolved {resolved} of {len(key_index)} users in {elapsed:.2f}s")
+        print(f"  No reading today: {int(np.count_nonzero((key_index < 0) & ~unknown_plan))}")
+        if unknown_plan.any():
+            unknown_ids = sorted(set(np.asarray(plan_ids, dtype=str)[unknown_plan].tolist()))
+            print(f"  Unknown planId: {int(np.count_nonzero(unknown_plan))} users ({', '.join(repr(p) for p in unknown_ids[:10])})")
+
+        if not args.users:
+            for i in range(3):
+                day = reading_for(resolver, key_index[i])
+                print(f"  {user_ids[i]} ({plan_ids[i]}, {timezones[i]}, +{start_offsets[i]}d): {ordinal_to_date(local_dates[i])} -> "
+                      f"{'Day ' + str(day['dayNumber']) + ' ' + day.get('rawReading', '') if day else 'no reading'}")
+        else:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                for uid, pid, k, local in zip(user_ids, plan_ids, key_index.tolist(), local_dates.tolist()):
+                    day = reading_for(resolver, k)
+                    f.write(json.dumps({
+                        'userId': uid,
+                        'planId': str(pid),
+                        'localDate': ordinal_to_date(local),
+                        'dayNumber': day['dayNumber'] if day else None,
+                        'portions': day['portions'] if day else None
+                    }, ensure_ascii=False) + '\n')
+            print(f"\nData saved to {args.output}")
+
+    except Exception as e:
+        print(f"Error: {e}")
+        import traceback
+        traceback.print_exc()
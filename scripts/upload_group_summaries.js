@@ -0,0 +1,71 @@
+const path = require('path');
+const { ensureFirebaseInitialized } = require('../config/firebase');
+
+// Upload the output of analytics/progress_analytics.py so the API can serve it:
+//   node scripts/upload_group_summaries.js group_progress_summaries.json
+//
+// Each group's summary goes to groupReadingSchedules/<groupId>/analytics/progressSummary,
+// served by GET /api/group-progress-summary/:groupId.
+
+// Summaries carry a per-member map, so keep batches well under the 10 MB request limit
+const BATCH_SIZE = 50;
+
+async function uploadGroupSummaries(summariesFile) {
+  const output = require(path.resolve(summariesFile));
+  await ensureFirebaseInitialized();
+  const db = require('../config/firebase').db;
+
+  const groupIds = Object.keys(output.groups);
+  console.log(`Uploading progress summaries for ${groupIds.length} groups...`);
+
+  let batch = db.batch();
+  let batchCount = 0;
+  let uploaded = 0;
+
+  for (const groupId of groupIds) {
+    const summaryRef = db
+      .collection('groupReadingSchedules')
+      .doc(groupId)
+      .collection('analytics')
+      .doc('progressSummary');
+
+    batch.set(summaryRef, {
+      ...output.groups[groupId],
+      generatedAt: output.generatedAt,
+      asOf: output.asOf || null
+    });
+    batchCount++;
+    uploaded++;
+
+    if (batchCount >= BATCH_SIZE) {
+      await batch.commit();
+      console.log(`✓ Committed ${uploaded}/${groupIds.length} summaries`);
+      batch = db.batch();
+      batchCount = 0;
+    }
+  }
+
+  if (batchCount > 0) {
+    await batch.commit();
+  }
+
+  return uploaded;
+}
+
+if (require.main === module) {
+  const summariesFile = process.argv[2] || 'group_progress_summaries.json';
+
+  uploadGroupSummaries(summariesFile)
+    .then(uploaded => {
+      console.log(`\n🎉 Uploaded ${uploaded} group progress summaries`);
+      process.exit(0);
+    })
+    .catch(error => {
+      console.error('\n❌ Upload failed:', error);
+      process.exit(1);
+    });
+}
+
+module.exports = {
+  uploadGroupSummaries
+};
@@ -0,0 +1,104 @@
+const path = require('path');
+const { ensureFirebaseInitialized } = require('../config/firebase');
+
+// Upload the output of extraction/split_template.py:
+//   node scripts/upload_template_instance.js templates/tpl-<hash>.json <planId>.instance.json
+//
+// The template is content-addressed, so if readingTemplates/<templateId> already
+// holds the same contentHash (e.g. a repeat school year) only the small instance
+// document is written. Instances live in readingPlanInstances/<planId>, apart from
+// the full plans in readingPlans.
+
+async function getDb() {
+  await ensureFirebaseInitialized();
+  return require('../config/firebase').db;
+}
+
+async function uploadTemplate(db, template) {
+  const templateRef = db.collection('readingTemplates').doc(template.templateId);
+  const existing = await templateRef.get();
+
+  if (existing.exists && existing.data().contentHash === template.contentHash) {
+    console.log(`✓ Template ${template.templateId} already uploaded, skipping ${template.dailyReadings.length} daily readings`);
+    return false;
+  }
+
+  const { dailyReadings, ...templateData } = template;
+  const batchSize = 500; // Firestore batch limit
+  let batch = db.batch();
+  let batchCount = 0;
+
+  for (const day of dailyReadings) {
+    const dayId = String(day.dayNumber).padStart(3, '0');
+    batch.set(templateRef.collection('dailyReadings').doc(dayId), day);
+    batchCount++;
+
+    if (batchCount >= batchSize) {
+      await batch.commit();
+      console.log(`✓ Committed batch of ${batchCount} daily readings`);
+      batch = db.batch();
+      batchCount = 0;
+    }
+  }
+
+  if (batchCount > 0) {
+    await batch.commit();
+    console.log(`✓ Committed final batch of ${batchCount} daily readings`);
+  }
+
+  // Written last: the contentHash marks the template complete, so a failed
+  // batch above leaves it to be retried instead of skipped on the next run
+  await templateRef.set({
+    ...templateData,
+    updatedAt: new Date().toISOString()
+  });
+  console.log(`✓ Wrote template document ${template.templateId}`);
+
+  return true;
+}
+
+async function uploadInstance(db, instance) {
+  await db.collection('readingPlanInstances').doc(instance.planId).set({
+    ...instance,
+    updatedAt: new Date().toISOString()
+  });
+  console.log(`✓ Wrote plan instance ${instance.planId} → ${instance.templateId} (${instance.startDate} - ${instance.endDate})`);
+}
+
+async function uploadTemplateInstance(templateFile, instanceFile) {
+  const template = require(path.resolve(templateFile));
+  const instance = require(path.resolve(instanceFile));
+
+  if (instance.templateId !== template.templateId || instance.contentHash !== template.contentHash) {
+    throw new Error(`Instance ${instance.planId} points at ${instance.templateId}, not ${template.templateId}`);
+  }
+
+  const db = await getDb();
+  const uploaded = await uploadTemplate(db, template);
+  await uploadInstance(db, instance);
+  return uploaded;
+}
+
+if (require.main === module) {
+  const [templateFile, instanceFile] = process.argv.slice(2);
+  if (!templateFile || !instanceFile) {
+    console.error('Usage: node scripts/upload_template_instance.js <template.json> <instance.json>');
+    process.exit(1);
+  }
+
+  uploadTemplateInstance(templateFile, instanceFile)
+    .then(uploaded => {
+      console.log(uploaded ? '\n🎉 Template and instance uploaded' : '\n🎉 Instance uploaded (template reused)');
+      process.exit(0);
+    })
+    .catch(error => {
+      console.error('\n❌ Upload failed:', error);
+      process.exit(1);
+    });
+}
+
+module.exports = {
+  uploadTemplate,
+  uploadInstance,
+  uploadTemplateInstance
+};
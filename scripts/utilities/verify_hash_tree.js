@@ -0,0 +1,332 @@
+const crypto = require('crypto');
+const path = require('path');
+const { ensureFirebaseInitialized } = require('../../config/firebase');
+
+// Hash-tree upload verification for dailyReadings/day-NNN documents.
+//
+// extraction/hash_tree.py writes <schedule>.hashtree.json. After uploading the
+// day documents, store their hash tree with --upload, then verify any time:
+//
+//   node scripts/utilities/verify_hash_tree.js nt_reading_schedule_crossbook.hashtree.json --upload
+//   node scripts/utilities/verify_hash_tree.js nt_reading_schedule_crossbook.hashtree.json
+//
+// --upload reads the day documents back once and hashes them as stored, so the
+// stored tree describes what is really in Firestore; it also reports any days
+// that differ from the local tree. The root is written last, after every node
+// batch has committed.
+//
+// Verification reads the stored root first; a correct upload costs one read.
+// On a mismatch it only descends into subtrees whose hashes differ, then
+// reads and re-hashes just the day documents under them. Leaves are laid out
+// by dayNumber, so a missing day document costs a few reads, not a full scan.
+// Set FIRESTORE_EMULATOR_HOST to check against a local emulator.
+
+const DEFAULT_PLAN_PATH = 'readingPlans/newtestamentyp';
+
+// Must match DAY_FIELDS / PORTION_FIELDS in extraction/hash_tree.py
+const DAY_FIELDS = ['dayNumber', 'date', 'dayOfWeek', 'startBookName', 'startBookId', 'endBookName', 'endBookId', 'portions', 'rawReading'];
+const PORTION_FIELDS = ['bookId', 'bookName', 'startChapter', 'startVerse', 'endChapter', 'endVerse', 'portionOrder'];
+
+function stableStringify(value) {
+  if (Array.isArray(value)) {
+    return `[${value.map(stableStringify).join(',')}]`;
+  }
+  if (value && typeof value === 'object') {
+    const keys = Object.keys(value).sort();
+    return `{${keys.map(key => `${JSON.stringify(key)}:${stableStringify(value[key])}`).join(',')}}`;
+  }
+  return JSON.stringify(value);
+}
+
+function canonicalDay(day) {
+  const record = {};
+  for (const field of DAY_FIELDS) {
+    let value = day[field];
+    if (value === undefined || value === null || (field === 'rawReading' && !value)) {
+      continue;
+    }
+    if (field === 'portions') {
+      value = value.map(portion => {
+        const cleaned = {};
+        for (const key of PORTION_FIELDS) {
+          if (portion[key] !== undefined && portion[key] !== null) {
+            cleaned[key] = portion[key];
+          }
+        }
+        return cleaned;
+      });
+    }
+    record[field] = value;
+  }
+  return stableStringify(record);
+}
+
+function sha256(text) {
+  return crypto.createHash('sha256').update(text, 'utf8').digest('hex');
+}
+
+function leafHash(day) {
+  return sha256('leaf:' + canonicalDay(day));
+}
+
+// Must match MISSING_LEAF in extraction/hash_tree.py
+const MISSING_LEAF = sha256('missing');
+
+function nodeHash(hashes) {
+  return sha256('node:' + hashes.join(''));
+}
+
+// Same layout as build_hash_tree() in extraction/hash_tree.py: leaf N-1 is day N
+function buildHashTree(days, fanout, dayCount = 0) {
+  const byDay = new Map(days.map(day => [day.dayNumber, day]));
+  const count = Math.max(dayCount, ...[...byDay.keys()].filter(Number.isInteger));
+  const leaves = [];
+  for (let dayNumber = 1; dayNumber <= count; dayNumber++) {
+    leaves.push(byDay.has(dayNumber) ? leafHash(byDay.get(dayNumber)) : MISSING_LEAF);
+  }
+  const levels = [leaves];
+  while (levels[levels.length - 1].length > 1) {
+    const below = levels[levels.length - 1];
+    const level = [];
+    for (let i = 0; i < below.length; i += fanout) {
+      level.push(nodeHash(below.slice(i, i + fanout)));
+    }
+    levels.push(level);
+  }
+
+  return {
+    algorithm: 'sha256',
+    fanout: fanout,
+    dayCount: count,
+    root: levels[0].length > 0 ? levels[levels.length - 1][0] : nodeHash([]),
+    levels: levels
+  };
+}
+
+function nodeId(level, index) {
+  return `L${level}-${String(index).padStart(3, '0')}`;
+}
+
+function dayDocId(dayNumber) {
+  return `day-${String(dayNumber).padStart(3, '0')}`;
+}
+
+// Day numbers covered by node `index` at `level`
+function nodeRange(tree, level, index) {
+  const span = Math.pow(tree.fanout, level);
+  const first = index * span;
+  const last = Math.min(first + span, tree.dayCount) - 1;
+  return { startDay: first + 1, endDay: last + 1 };
+}
+
+function childHashes(tree, level, index) {
+  if (level === 0) return [];
+  return tree.levels[level - 1].slice(index * tree.fanout, (index + 1) * tree.fanout);
+}
+
+async function uploadHashTree(db, planPath, fanout, dayCount) {
+  const planRef = db.doc(planPath);
+  const treeRef = planRef.collection('hashTree');
+
+  // Hash the day documents as they are stored, not the local extraction output
+  const snapshot = await planRef.collection('dailyReadings').get();
+  const tree = buildHashTree(snapshot.docs.map(doc => doc.data()), fanout, dayCount);
+  const top = tree.levels.length - 1;
+
+  // Drop the old root first: until the new one is written, verification
+  // treats the tree as missing instead of trusting half-written nodes
+  await treeRef.doc('root').delete();
+
+  const batchSize = 500; // Firestore batch limit
+  let batch = db.batch();
+  let batchCount = 0;
+
+  for (let level = 1; level < top; level++) {
+    for (let index = 0; index < tree.levels[level].length; index++) {
+      batch.set(treeRef.doc(nodeId(level, index)), {
+        level: level,
+        index: index,
+        ...nodeRange(tree, level, index),
+        hash: tree.levels[level][index],
+        childHashes: childHashes(tree, level, index)
+      });
+      batchCount++;
+
+      if (batchCount >= batchSize) {
+        await batch.commit();
+        batch = db.batch();
+        batchCount = 0;
+      }
+    }
+  }
+
+  if (batchCount > 0) {
+    await batch.commit();
+  }
+
+  await treeRef.doc('root').set({
+    algorithm: tree.algorithm,
+    fanout: tree.fanout,
+    dayCount: tree.dayCount,
+    height: tree.levels.length,
+    hash: tree.root,
+    childHashes: childHashes(tree, top, 0),
+    updatedAt: new Date().toISOString()
+  });
+  console.log(`✓ Uploaded hash tree of ${tree.dayCount} stored days to ${planPath}/hashTree (root ${tree.root.slice(0, 12)}…)`);
+  return tree;
+}
+
+// Day numbers whose stored leaf hash differs from the local tree
+function diffLeaves(stored, local) {
+  const days = [];
+  const count = Math.max(stored.dayCount, local.dayCount);
+  for (let i = 0; i < count; i++) {
+    if ((stored.levels[0][i] || MISSING_LEAF) !== (local.levels[0][i] || MISSING_LEAF)) {
+      days.push(i + 1);
+    }
+  }
+  return days;
+}
+
+async function verifyHashTree(db, planPath, tree) {
+  const planRef = db.doc(planPath);
+  const treeRef = planRef.collection('hashTree');
+  const top = tree.levels.length - 1;
+  let reads = 1;
+
+  const rootDoc = await treeRef.doc('root').get();
+  const root = rootDoc.exists ? rootDoc.data() : null;
+
+  if (root && root.hash === tree.root) {
+    return { ok: true, reads: reads, mismatchedDays: [] };
+  }
+
+  // Collect leaf indexes whose stored hash differs from the local tree
+  let suspectLeaves = [];
+
+  if (!root || root.fanout !== tree.fanout || root.dayCount !== tree.dayCount || root.height !== tree.levels.length) {
+    // Different tree shape - subtree hashes can't be compared, check every day
+    console.log('Stored hash tree missing or shaped differently, checking all days');
+    suspectLeaves = tree.levels[0].map((_, i) => i);
+  } else if (top === 0) {
+    suspectLeaves = [0];
+  } else {
+    // Walk down level by level, fetching only nodes whose hash differs
+    let pending = [{ level: top, index: 0, stored: root.childHashes }];
+
+    while (pending.length > 0) {
+      const nextRefs = [];
+      const nextNodes = [];
+
+      for (const node of pending) {
+        const expected = childHashes(tree, node.level, node.index);
+        expected.forEach((hash, i) => {
+          if (node.stored[i] === hash) return;
+          const childIndex = node.index * tree.fanout + i;
+          if (node.level - 1 === 0) {
+            suspectLeaves.push(childIndex);
+          } else {
+            nextRefs.push(treeRef.doc(nodeId(node.level - 1, childIndex)));
+            nextNodes.push({ level: node.level - 1, index: childIndex });
+          }
+        });
+      }
+
+      if (nextRefs.length === 0) break;
+      const docs = await db.getAll(...nextRefs);
+      reads += docs.length;
+      pending = docs.map((doc, i) => ({
+        ...nextNodes[i],
+        stored: doc.exists ? doc.data().childHashes || [] : []
+      }));
+    }
+  }
+
+  // Read and re-hash only the day documents under mismatching leaves
+  const mismatchedDays = [];
+  if (suspectLeaves.length > 0) {
+    const dayRefs = suspectLeaves.map(i => planRef.collection('dailyReadings').doc(dayDocId(i + 1)));
+    const dayDocs = await db.getAll(...dayRefs);
+    reads += dayDocs.length;
+
+    dayDocs.forEach((doc, i) => {
+      const leaf = suspectLeaves[i];
+      const expected = tree.levels[0][leaf];
+      if (!doc.exists) {
+        if (expected !== MISSING_LEAF) {
+          mismatchedDays.push({ dayNumber: leaf + 1, docId: doc.id, problem: 'missing' });
+        }
+      } else if (expected === MISSING_LEAF) {
+        mismatchedDays.push({ dayNumber: leaf + 1, docId: doc.id, problem: 'not in schedule' });
+      } else if (leafHash(doc.data()) !== expected) {
+        mismatchedDays.push({ dayNumber: leaf + 1, docId: doc.id, problem: 'content differs' });
+      }
+    });
+  }
+
+  return {
+    ok: mismatchedDays.length === 0,
+    staleTree: mismatchedDays.length === 0,
+    reads: reads,
+    mismatchedDays: mismatchedDays
+  };
+}
+
+async function main() {
+  const args = process.argv.slice(2);
+  const planIndex = args.indexOf('--plan');
+  const planPath = planIndex >= 0 ? args[planIndex + 1] : DEFAULT_PLAN_PATH;
+  // The positional tree file, skipping the value that follows --plan
+  const treeFile = args.find((arg, i) => !arg.startsWith('--') && (planIndex < 0 || i !== planIndex + 1));
+
+  if (!treeFile) {
+    throw new Error('Usage: node verify_hash_tree.js <tree.json> [--plan readingPlans/<planId>] [--upload]');
+  }
+
+  const tree = require(path.resolve(treeFile));
+  await ensureFirebaseInitialized();
+  const db = require('../../config/firebase').db;
+
+  if (args.includes('--upload')) {
+    const stored = await uploadHashTree(db, planPath, tree.fanout, tree.dayCount);
+    if (stored.root !== tree.root) {
+      const days = diffLeaves(stored, tree);
+      console.log(`❌ Stored day documents differ from ${treeFile} on ${days.length} day(s): ${days.join(', ')}`);
+      process.exitCode = 1;
+    }
+    return;
+  }
+
+  console.log(`Verifying ${planPath} against hash tree (${tree.dayCount} days)...\n`);
+  const result = await verifyHashTree(db, planPath, tree);
+
+  if (result.ok && !result.staleTree) {
+    console.log(`✅ Upload matches (root hash verified, ${result.reads} read)`);
+  } else if (result.ok) {
+    console.log(`⚠️  Day documents match but the stored hash tree is stale - re-run with --upload (${result.reads} reads)`);
+  } else {
+    console.log(`❌ ${result.mismatchedDays.length} day(s) differ (${result.reads} reads):`);
+    result.mismatchedDays.forEach(day => {
+      console.log(`  Day ${day.dayNumber} (${day.docId}): ${day.problem}`);
+    });
+    process.exitCode = 1;
+  }
+}
+
+if (require.main === module) {
+  main()
+    .then(() => process.exit(process.exitCode || 0))
+    .catch(error => {
+      console.error('Error verifying hash tree:', error);
+      process.exit(1);
+    });
+}
+
+module.exports = {
+  canonicalDay,
+  leafHash,
+  buildHashTree,
+  uploadHashTree,
+  verifyHashTree
+};
@@ -9,6 +9,7 @@ const { createReadingSchedule } = require('./api/create-reading-schedule');
 const { createGroupReadingSchedule } = require('./api/create-group-reading-schedule');
 const { joinGroupReadingSchedule, leaveGroupReadingSchedule } = require('./api/join-group-reading-schedule');
 const { getGroupMembers } = require('./api/get-group-members');
+const { getGroupProgressSummary } = require('./api/get-group-progress-summary');
 const { getAvailableGroups } = require('./api/get-available-groups');
 const { getUserSchedules } = require('./api/get-user-schedules');
 const { markReadingCompleted } = require('./api/mark-reading-completed');
@@ -40,6 +41,7 @@ app.post('/api/create-group-reading-schedule', createGroupReadingSchedule);
 app.post('/api/join-group-reading-schedule', joinGroupReadingSchedule);
 app.post('/api/leave-group-reading-schedule', leaveGroupReadingSchedule);
 app.get('/api/group-members/:groupId', getGroupMembers);
+app.get('/api/group-progress-summary/:groupId', getGroupProgressSummary);
 app.get('/api/available-groups', getAvailableGroups);
 
 // Reading Progress endpoints
@@ -157,6 +159,10 @@ app.get('/', (req, res) => {
           description: 'Get all members of a group with roles and progress',
           response: 'Array of member objects with user info and reading progress'
         },
+        'GET /api/group-progress-summary/:groupId': {
+          description: 'Get precomputed group progress stats (completion rates, streaks, lagging members)',
+          response: 'Summary object written by the progress analytics batch job'
+        },
         'GET /api/available-groups': {
           description: 'Get all public groups available to join',
           response: 'Array of group objects with member counts and capacity info'